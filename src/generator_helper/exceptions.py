@@ -12,11 +12,21 @@ class GeneratorRuntimeError(Exception):
         self.rnd = rnd
 
 
+def _tle_repr(self) -> str:
+    return "TimeLimitExceededError('TLE')"
+
+
+def _tle_str(self) -> str:
+    return "TLE"
+
+
 TimeLimitExceededError = FunctionTimedOut
-TimeLimitExceededError.__repr__ = lambda self: "TimeLimitExceededError('TLE')"
-TimeLimitExceededError.__str__ = lambda self: "TLE"
-TimeLimitExceededError.__module__ = __name__
-TimeLimitExceededError.__name__ = "TimeLimitExceededError"
-TimeLimitExceededError.__qualname__ = "TimeLimitExceededError"
+# Patch only once, so reloading this module leaves the class untouched
+if getattr(TimeLimitExceededError, "__name__", None) != "TimeLimitExceededError":
+    TimeLimitExceededError.__repr__ = _tle_repr
+    TimeLimitExceededError.__str__ = _tle_str
+    TimeLimitExceededError.__module__ = __name__
+    TimeLimitExceededError.__name__ = "TimeLimitExceededError"
+    TimeLimitExceededError.__qualname__ = "TimeLimitExceededError"
 
 TLE = TimeLimitExceededError
@@ -4,10 +4,15 @@ testutils.py
 
 Provides utilities for reading and writing test cases to files.
 """
-import inspect
+import os
+import struct
+import sys
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional
+from string import Formatter
+from typing import Callable, Iterable, Optional
 from warnings import warn
 
 
@@ -15,6 +20,131 @@ from warnings import warn
 DEFAULT_IN_PATTERN = "{index}.in"
 DEFAULT_OUT_PATTERN = "{index}.out"
 
+# Aggregated bundle filenames
+AGGREGATE_DATA_NAME = "testcases.bin"
+AGGREGATE_INDEX_NAME = "testcases.idx"
+
+# Per-case header in the data file: (len_in, len_out)
+_CASE_HEADER = struct.Struct("<QQ")
+# Per-case entry in the index file: (idx, offset_in, len_in, offset_out, len_out)
+_INDEX_ENTRY = struct.Struct("<qQQQQ")
+
+# Default test case folders, keyed by the calling source file
+_caller_folder_cache: dict[str, Path] = {}
+
+# Flags for creating/truncating a test case file with os.open
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file using raw file descriptor calls.
+
+    Skips the buffered/text I/O layers of Path.write_text, which only add
+    per-file object construction for payloads that are already encoded.
+
+    Args:
+        path: The file to create or truncate.
+        data: The encoded contents to write.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd; os.write may write less than requested for large payloads."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _writev_all(fd: int, buffers: list[bytes]) -> None:
+    """
+    Write several buffers to fd back to back, in one os.writev call where available.
+
+    Falls back to a single os.write of the joined buffers on platforms without
+    os.writev (e.g. Windows), and finishes short vectored writes with os.write.
+    """
+    if not hasattr(os, "writev"):
+        _write_all(fd, b"".join(buffers))
+        return
+    written = os.writev(fd, buffers)
+    if written < sum(map(len, buffers)):
+        _write_all(fd, b"".join(buffers)[written:])
+
+
+def _split_pattern(pattern: str) -> Optional[tuple[str, str]]:
+    """
+    Split a filename pattern around its '{index}' replacement field.
+
+    Args:
+        pattern: A filename pattern containing '{index}'.
+
+    Returns:
+        The (prefix, suffix) literals, with '{{'/'}}' escapes already resolved,
+        if the only replacement field is a bare '{index}'; None for patterns
+        with format specs, conversions or other fields.
+    """
+    fields = list(Formatter().parse(pattern))
+    positions = [i for i, (_, field_name, _, _) in enumerate(fields) if field_name is not None]
+    if len(positions) != 1:
+        return None
+    position = positions[0]
+    _, field_name, format_spec, conversion = fields[position]
+    if field_name != "index" or format_spec or conversion is not None:
+        return None
+
+    # parse() also splits literals at every '{{'/'}}' escape, so the field is
+    # not necessarily in the first tuple; everything up to it is the prefix.
+    prefix = "".join(literal for literal, _, _, _ in fields[:position + 1])
+    suffix = "".join(literal for literal, _, _, _ in fields[position + 1:])
+    # The split must name files exactly like str.format does
+    if f"{prefix}0{suffix}" != pattern.format(index=0):
+        return None
+    return prefix, suffix
+
+
+# Source of a writer specialized for one filename pattern by _compile_writer
+_WRITER_TEMPLATE = """\
+def write(folder_str, idx, data):
+    fd = os_open(folder_str + {prefix!r} + str(idx) + {suffix!r}, FLAGS, 0o644)
+    try:
+        write_all(fd, data)
+    finally:
+        os_close(fd)
+"""
+
+
+def _compile_writer(pattern: str) -> Callable[[str, int, bytes], None]:
+    """
+    Build a function writing one test case file named after the given pattern.
+
+    For a pattern with a bare '{index}' field, the pattern's literal prefix and
+    suffix are baked into generated source, so that each call only concatenates
+    strings, opens the file and writes it with _write_all. Any other pattern falls back
+    to str.format and _write_file.
+
+    Args:
+        pattern: A filename pattern containing '{index}'.
+
+    Returns:
+        A callable (folder_str, idx, data) writing data to
+        folder_str + <pattern formatted with idx>, where folder_str ends with
+        a path separator.
+    """
+    if (parts := _split_pattern(pattern)) is None:
+        def write(folder_str: str, idx: int, data: bytes) -> None:
+            _write_file(folder_str + pattern.format(index=idx), data)
+        return write
+
+    prefix, suffix = parts
+    namespace = {"os_open": os.open, "os_close": os.close, "write_all": _write_all, "FLAGS": _WRITE_FLAGS}
+    exec(_WRITER_TEMPLATE.format(prefix=prefix, suffix=suffix), namespace)
+    return namespace["write"]
+
 
 def write_testcases(
     *,
@@ -22,7 +152,9 @@ def write_testcases(
     testcases: Iterable[tuple[str, str]],
     in_pattern: str = DEFAULT_IN_PATTERN,
     out_pattern: str = DEFAULT_OUT_PATTERN,
-    start: int = 1
+    start: int = 1,
+    aggregate: bool = False,
+    parallel: bool = True
 ) -> None:
     """
     Write input/output test cases to files in the specified folder.
@@ -40,18 +172,26 @@ def write_testcases(
         in_pattern: A pattern for naming input files (must include '{index}').
         out_pattern: A pattern for naming output files (must include '{index}').
         start: The starting index for naming files, default to 1.
+        aggregate: If True, write every test case into a single bundle
+                   (<folder>/testcases.bin) plus an offset index
+                   (<folder>/testcases.idx) instead of one file pair per case.
+                   Use read_testcase to read a case back. Defaults to False.
+        parallel: If True, write the files from a thread pool so that disk
+                  latency of independent files overlaps. Ignored when
+                  aggregate is True. Defaults to True.
 
     Notes:
         If patterns are invalid or collide, warns and falls back to default patterns:
             in: DEFAULT_IN_PATTERN ('{index}.in'), out: DEFAULT_OUT_PATTERN ('{index}.out')
     """
     if folder is None:
-        if (frame := inspect.currentframe()) is not None \
-                and (caller_frame := frame.f_back) is not None:
-            caller_file = caller_frame.f_code.co_filename
-            folder = Path(caller_file).resolve().parent / "testcase"
-        else:
-            raise RuntimeError("Unable to determine caller's folder.")
+        try:
+            caller_file = sys._getframe(1).f_code.co_filename
+        except ValueError:
+            raise RuntimeError("Unable to determine caller's folder.") from None
+        # Source files don't move during a run, so resolve each one only once
+        if (folder := _caller_folder_cache.get(caller_file)) is None:
+            folder = _caller_folder_cache[caller_file] = Path(caller_file).resolve().parent / "testcase"
 
     # Validate placeholder presence
     if "{index}" not in in_pattern or "{index}" not in out_pattern:
@@ -68,18 +208,112 @@ def write_testcases(
         )
         in_pattern, out_pattern = DEFAULT_IN_PATTERN, DEFAULT_OUT_PATTERN
 
-    folder = Path(folder)
-    folder.mkdir(parents=True, exist_ok=True)
+    if not isinstance(folder, Path):
+        folder = Path(folder)
+    os.makedirs(folder, exist_ok=True)
+
+    if aggregate:
+        _write_aggregated(folder, testcases, start)
+        return
+
+    # Specialize one writer per pattern instead of formatting on every file
+    write_in = _compile_writer(in_pattern)
+    write_out = _compile_writer(out_pattern)
+
+    # Join names onto a plain string rather than building a Path per file
+    folder_str = os.fspath(folder) + os.sep
+
+    # Write contents
+    if parallel:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight: deque[Future] = deque()
+            for idx, (input_data, expected) in enumerate(testcases, start=start):
+                in_flight.append(executor.submit(write_in, folder_str, idx, input_data.encode("utf-8")))
+                in_flight.append(executor.submit(write_out, folder_str, idx, expected.encode("utf-8")))
+                # Cap queued writes so that held payloads scale with the
+                # workers rather than with the number of test cases; collecting
+                # results also re-raises any OSError here
+                while len(in_flight) > 2 * max_workers:
+                    in_flight.popleft().result()
+            for future in in_flight:
+                future.result()
+    else:
+        # Encode and write one case at a time, so only one case's payload is
+        # held in memory at once
+        for idx, (input_data, expected) in enumerate(testcases, start=start):
+            write_in(folder_str, idx, input_data.encode("utf-8"))
+            write_out(folder_str, idx, expected.encode("utf-8"))
+
+
+def _write_aggregated(folder: Path, testcases: Iterable[tuple[str, str]], start: int) -> None:
+    """
+    Write all test cases into one data file plus an offset index.
+
+    Each case in the data file is laid out as a little-endian (len_in, len_out)
+    u64 header followed by the input bytes and the expected output bytes.
+    The index file holds one packed (idx, offset_in, len_in, offset_out, len_out)
+    entry per case.
 
-    for idx, (input_data, expected) in enumerate(testcases, start=start):
-        # Generate filenames
-        in_name = in_pattern.format(index=idx)
-        out_name = out_pattern.format(index=idx)
+    Args:
+        folder: An existing directory to write the bundle into.
+        testcases: An iterable of (input_str, output_str) pairs.
+        start: The index assigned to the first test case.
+    """
+    entries = bytearray()
+    offset = 0
+    fd = os.open(folder / AGGREGATE_DATA_NAME, _WRITE_FLAGS, 0o644)
+    try:
+        for idx, (input_data, expected) in enumerate(testcases, start=start):
+            in_bytes = input_data.encode("utf-8")
+            out_bytes = expected.encode("utf-8")
+
+            # Header, input and output go out in a single vectored write
+            header = _CASE_HEADER.pack(len(in_bytes), len(out_bytes))
+            _writev_all(fd, [header, in_bytes, out_bytes])
+
+            offset_in = offset + _CASE_HEADER.size
+            offset_out = offset_in + len(in_bytes)
+            entries += _INDEX_ENTRY.pack(idx, offset_in, len(in_bytes), offset_out, len(out_bytes))
+            offset = offset_out + len(out_bytes)
+    finally:
+        os.close(fd)
+
+    (folder / AGGREGATE_INDEX_NAME).write_bytes(entries)
+
+
+def read_testcase(folder: Path, idx: int) -> tuple[str, str]:
+    """
+    Read a single test case back from a bundle written with aggregate=True.
+
+    Args:
+        folder: The directory containing testcases.bin and testcases.idx.
+        idx: The index of the test case, as numbered when it was written.
+
+    Returns:
+        A tuple (input_str, output_str).
+
+    Raises:
+        KeyError: If no test case with the given index exists in the bundle.
+    """
+    folder = Path(folder)
+    index_path = folder / AGGREGATE_INDEX_NAME
+    with open(index_path, "rb") as index_file:
+        # Indices are consecutive from the first entry's, so the entry for idx
+        # sits at a fixed position and only it needs to be read
+        first_entry = index_file.read(_INDEX_ENTRY.size)
+        entry = b""
+        if len(first_entry) == _INDEX_ENTRY.size \
+                and (position := idx - _INDEX_ENTRY.unpack(first_entry)[0]) >= 0:
+            index_file.seek(position * _INDEX_ENTRY.size)
+            entry = index_file.read(_INDEX_ENTRY.size)
+    if len(entry) != _INDEX_ENTRY.size:
+        raise KeyError(f"Test case {idx} not found in '{index_path}'.")
+    _, offset_in, len_in, offset_out, len_out = _INDEX_ENTRY.unpack(entry)
 
-        # Resolve full paths
-        in_path = folder / in_name
-        out_path = folder / out_name
+    # Input and output are stored back to back, so read them in one slice
+    with open(folder / AGGREGATE_DATA_NAME, "rb") as data_file:
+        data_file.seek(offset_in)
+        data = data_file.read(len_in + len_out)
 
-        # Write contents
-        in_path.write_text(input_data, encoding="utf-8")
-        out_path.write_text(expected, encoding="utf-8")
+    return data[:len_in].decode("utf-8"), data[len_in:].decode("utf-8")
@@ -7,11 +7,102 @@ typically representing a solution to a programming problem.
 """
 
 import sys
+import threading
 from io import StringIO
 from typing import Any, Callable, NoReturn
 from functools import wraps
 
 
+class _ListSink:
+    """
+    A minimal write-only stand-in for StringIO used to capture stdout.
+
+    Writes are appended to a list and joined once in getvalue(), which avoids
+    StringIO's internal buffer resizing when a solution prints many small chunks.
+    The text-stream attributes solutions commonly query (encoding, errors,
+    closed, isatty(), writable()) report the same values as StringIO.
+
+    Note that write and writelines are the list's own append/extend, so unlike
+    StringIO.write, write returns None rather than the number of characters.
+    """
+    __slots__ = ("chunks", "write", "writelines")
+
+    # Same values as io.StringIO reports
+    encoding = None
+    errors = None
+    closed = False
+
+    def __init__(self):
+        self.chunks: list[str] = []
+        self.write = self.chunks.append
+        self.writelines = self.chunks.extend
+
+    def flush(self) -> None:
+        """No-op, present so print(..., flush=True) works."""
+
+    def isatty(self) -> bool:
+        """Returns False, as for StringIO."""
+        return False
+
+    def writable(self) -> bool:
+        """Returns True, as for StringIO."""
+        return True
+
+    def getvalue(self) -> str:
+        """Returns everything written so far as a single string."""
+        return "".join(self.chunks)
+
+
+# Idle sinks reused across override_io calls. This is a plain list rather than
+# a threading.local, as func_timeout runs each solution call in a fresh thread;
+# list.pop and list.append are atomic, so threads can share it safely.
+_sink_pool: list[_ListSink] = []
+
+
+def _acquire_sink() -> _ListSink:
+    """Takes an empty sink from the pool, creating one if none is idle."""
+    try:
+        return _sink_pool.pop()
+    except IndexError:
+        return _ListSink()
+
+
+def _release_sink(sink: _ListSink) -> None:
+    """Empties a sink and returns it to the pool."""
+    sink.chunks.clear()
+    _sink_pool.append(sink)
+
+
+# Streams installed by override_io calls that are still running, oldest first.
+# On exit, a call hands sys.stdin/sys.stdout back to the newest remaining
+# in-flight stream, so nested calls resume the outer capture, and leaves it
+# alone if it belongs to another in-flight call (timed-out solutions abandoned
+# by func_timeout can outlive calls started after them).
+_active_stdins: list[StringIO] = []
+_active_stdouts: list[_ListSink] = []
+_streams_lock = threading.Lock()
+
+
+def _restore_stream(name: str, active: list, stream: Any, default: Any) -> None:
+    """
+    Ends one call's redirection of sys.<name>.
+
+    Args:
+        name: 'stdin' or 'stdout'.
+        active: The in-flight streams for that name.
+        stream: The stream this call installed, or None if it installed none.
+        default: The original stream to fall back on.
+    """
+    with _streams_lock:
+        if stream is not None:
+            active.remove(stream)
+        current = getattr(sys, name)
+        # Anything that isn't another in-flight call's stream (this call's own,
+        # or one the solution rebound itself) is replaced
+        if not any(current is other for other in active):
+            setattr(sys, name, active[-1] if active else default)
+
+
 def override_io(solution: Callable) -> Callable:
     """
     Decorator to redirect sys.stdin and sys.stdout for a function call.
@@ -47,7 +138,7 @@ def override_io(solution: Callable) -> Callable:
         # result will be 42
         # output will be "Received: hello\n"
     """
-    if not isinstance(solution, Callable):
+    if not callable(solution):
         raise TypeError("The 'solution' argument must be callable.")
 
     @wraps(solution)
@@ -70,25 +161,28 @@ def override_io(solution: Callable) -> Callable:
         if testcase is not None and not isinstance(testcase, str):
             raise TypeError("The 'testcase' argument must be a string or None.")
 
+        sink = _acquire_sink()
+        stdin = None
         try:
-            # Redirect stdin if testcase is provided
-            if testcase is not None:
-                sys.stdin = StringIO(testcase)
-            # Redirect stdout to capture output
-            sys.stdout = StringIO()
+            with _streams_lock:
+                # Redirect stdin if testcase is provided
+                if testcase is not None:
+                    sys.stdin = stdin = StringIO(testcase)
+                    _active_stdins.append(stdin)
+                # Redirect stdout to capture output
+                sys.stdout = sink
+                _active_stdouts.append(sink)
 
             # Execute the original function
             ret = solution(*args, **kwargs)
             # Get the captured output
-            output = sys.stdout.getvalue()
-
-        except Exception as e:
-            # If any exception occurs, re-raise it after cleanup
-            raise e
+            output = sink.getvalue()
         finally:
-            # Always restore original stdin and stdout
-            sys.stdin = sys.__stdin__
-            sys.stdout = sys.__stdout__
+            # Restore stdin and stdout. Nothing restores back to this sink
+            # once it has left _active_stdouts, so it can be recycled.
+            _restore_stream("stdin", _active_stdins, stdin, sys.__stdin__)
+            _restore_stream("stdout", _active_stdouts, sink, sys.__stdout__)
+            _release_sink(sink)
 
         # Return the original function's return value and the captured output
         return ret, output
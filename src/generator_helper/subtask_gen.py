@@ -7,12 +7,25 @@ them against expected outcomes using a verifier function. Includes features
 like reproducible randomness and custom assertions for test case validation.
 """
 
+import linecache
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
 import traceback
+import weakref
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from hashlib import blake2b
+from multiprocessing.context import BaseContext
 from random import Random
 from typing import Callable, Any, NoReturn, Optional, Protocol
 
 from .exceptions import TestcaseInvalidError, GeneratorRuntimeError
 
+logger = logging.getLogger(__name__)
+
 
 class SupportsBool(Protocol):
     def __bool__(self) -> bool: ...
@@ -20,7 +33,8 @@ class SupportsBool(Protocol):
 
 class ReproducibleRandom(Random):
     """
-    A subclass of random.Random that stores its initial seed and state.
+    A subclass of random.Random that stores its initial seed, from which the
+    initial state is rebuilt on demand.
 
     This allows resetting the generator to its exact starting point, although
     the current 'generator_runner' implementation creates a new instance for
@@ -33,16 +47,41 @@ class ReproducibleRandom(Random):
 
         Args:
             seed: An optional integer seed for the random number generator.
-                  If None, the generator is initialized using default sources
-                  of randomness.
+                  If None, a seed is drawn from os.urandom, so that the
+                  initial state can still be reproduced from it.
         """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(32), "big")
         super().__init__(seed)
         self._seed = seed
-        self.initial_state = self.getstate()  # Store the initial state
+        self._initial_state: Optional[tuple] = None
+
+    @property
+    def initial_state(self) -> tuple:
+        """
+        The generator state right after seeding.
+
+        Computed from the seed on first access rather than snapshotted in
+        __init__, since it is normally only needed when reporting an error.
+        """
+        if self._initial_state is None:
+            self._initial_state = Random(self._seed).getstate()
+        return self._initial_state
 
     def back_to_initial(self):
         """Resets the random generator state to its initial state."""
-        self.setstate(self.initial_state)
+        self.seed(self._seed)
+
+    def __reduce__(self):
+        # random.Random pickles only the generator state, dropping instance
+        # attributes such as the seed; keep them so the initial state survives
+        # being sent back from a worker process.
+        return self.__class__, (self._seed,), (self.getstate(), self.__dict__)
+
+    def __setstate__(self, state):
+        random_state, attributes = state
+        self.setstate(random_state)
+        self.__dict__.update(attributes)
 
 
 def assert_testcase(statement: SupportsBool, msg: Any = "", *, from_: Optional[Exception] = None) -> None | NoReturn:
@@ -66,11 +105,10 @@ def assert_testcase(statement: SupportsBool, msg: Any = "", *, from_: Optional[E
         return
 
     # Assertion failed, gather context
-    stack = traceback.extract_stack()
     # Get the frame where assert_testcase was called from
-    caller_frame = stack[-2]
+    caller_frame = sys._getframe(1)
     # Get the source code line of the assertion call
-    caller_statement = caller_frame.line.strip()
+    caller_statement = linecache.getline(caller_frame.f_code.co_filename, caller_frame.f_lineno).strip()
 
     error_message = f"{msg} <- Assertion failed at: '{caller_statement}'"
 
@@ -81,9 +119,92 @@ def assert_testcase(statement: SupportsBool, msg: Any = "", *, from_: Optional[E
         raise TestcaseInvalidError(error_message) from from_
 
 
+class _VerifierCache:
+    """
+    An LRU cache of rejected test cases around a verifier.
+
+    Only rejections are remembered, since an accepted test case ends the retry
+    loop and is never verified again. Entries are keyed by testcase_index and
+    a 16-byte BLAKE2b digest of the test case, and hold just the message of the
+    TestcaseInvalidError, so memory does not grow with testcase size and no
+    traceback or verifier frames are kept alive. A hit raises a fresh
+    TestcaseInvalidError with that message. Other exceptions propagate as usual.
+    """
+
+    def __init__(self, verifier: Callable[[int, str], str | NoReturn], maxsize: int = 1024):
+        self.verifier = verifier
+        self.maxsize = maxsize
+        self.rejections: OrderedDict[tuple[int, bytes], str] = OrderedDict()
+
+    def __call__(self, testcase_index: int, testcase: str) -> str | NoReturn:
+        key = (testcase_index, blake2b(testcase.encode("utf-8"), digest_size=16).digest())
+        if (message := self.rejections.get(key)) is not None:
+            self.rejections.move_to_end(key)
+            raise TestcaseInvalidError(message)
+
+        try:
+            return self.verifier(testcase_index, testcase)
+        except TestcaseInvalidError as e:
+            self.rejections[key] = str(e)
+            if len(self.rejections) > self.maxsize:
+                self.rejections.popitem(last=False)
+            raise
+
+
+# Generator and verifier of the current worker process, set by _init_worker
+_worker_generator: Optional[Callable[[int, Random], str]] = None
+_worker_verifier: Optional[Callable[[int, str], str | NoReturn]] = None
+
+
+def _init_worker(generator: Callable[[int, Random], str],
+                 verifier: Callable[[int, str], str | NoReturn]) -> None:
+    """Process pool initializer storing the generator and verifier for _attempt."""
+    global _worker_generator, _worker_verifier
+    _worker_generator = generator
+    _worker_verifier = verifier
+
+
+class _WorkerError(Exception):
+    """
+    Stands in, in the parent process, for an exception raised in a worker.
+
+    Its message is the worker's formatted traceback.
+    """
+
+
+def _attempt(testcase_index: int) -> tuple[str, Any, ReproducibleRandom]:
+    """
+    Runs one generate-and-verify attempt inside a worker process.
+
+    Exceptions are returned rather than raised so that the random generator
+    used for the attempt always makes it back to the parent process. They are
+    returned as strings, since not every exception can be unpickled.
+
+    Returns:
+        A tuple (status, payload, rnd) where status is "ok" with payload
+        (testcase, answer), "invalid" with the TestcaseInvalidError message,
+        or "error" with (exception type name, formatted traceback) for any
+        other exception.
+    """
+    rnd = ReproducibleRandom()
+    try:
+        testcase = _worker_generator(testcase_index, rnd)
+        answer = _worker_verifier(testcase_index, testcase)
+        return "ok", (testcase, answer), rnd
+    except TestcaseInvalidError as e:
+        return "invalid", str(e), rnd
+    except Exception as e:
+        error_type = f"{type(e).__module__}.{type(e).__qualname__}"
+        return "error", (error_type, traceback.format_exc()), rnd
+
+
 def generator_runner(generator: Callable[[int, Random], str],
                      verifier: Callable[[int, str], str | NoReturn],
-                     retry_limit: int = -1) -> Callable[[int], tuple[str, str] | NoReturn]:
+                     retry_limit: int = -1,
+                     parallel: int = 1,
+                     dedupe: bool = True,
+                     verbose: bool = False,
+                     mp_context: Optional[BaseContext] = None) -> Callable[[int], tuple[str, str] | NoReturn]:
     """
     Creates a runner function that generates and verifies a test case.
 
@@ -105,10 +226,32 @@ def generator_runner(generator: Callable[[int, Random], str],
         retry_limit: The maximum number of times to retry generation/verification
                      if TestcaseInvalidError is raised. A value of -1 means
                      retry indefinitely (original behavior). Defaults to -1.
+        parallel: The number of attempts to keep in flight at once. Values
+                  greater than 1 run attempts in a process pool (processes,
+                  since solutions redirect the global sys.stdin/sys.stdout) and
+                  return the first valid test case. Unless workers are started
+                  with 'fork', the generator and verifier must be picklable,
+                  e.g. module-level functions or a verifier from
+                  verifier_factory whose solutions are module-level.
+                  Defaults to 1 (sequential).
+        dedupe: If True, remember recently rejected (testcase_index, testcase)
+                pairs, so a rejected test case regenerated by a later attempt
+                is not verified again. With parallel > 1
+                each worker process keeps its own cache. Defaults to True.
+        verbose: If True, print a message for every rejected attempt. Otherwise
+                 the messages go to this module's logger at DEBUG level, which
+                 also keeps them out of stdout captured by override_io.
+                 Defaults to False.
+        mp_context: The multiprocessing context used to start worker processes
+                    when parallel > 1. Defaults to the platform's default
+                    start method.
 
     Returns:
         A runner function. This runner function takes a test case index (int)
         and returns a tuple (testcase_string, answer_string) if successful.
+        Its close() method shuts down the worker pool started for parallel > 1
+        (a no-op otherwise); the pool is also shut down once the runner is
+        garbage collected. Calling the runner after close() starts a new pool.
 
     Raises:
         GeneratorRuntimeError: Wraps unexpected exceptions from the generator
@@ -116,7 +259,34 @@ def generator_runner(generator: Callable[[int, Random], str],
                                for reproducibility.
         RuntimeError: If a valid test case cannot be generated within the
                       specified retry_limit.
+        ValueError: If parallel is less than 1.
+        TypeError: If parallel > 1, workers are not started with 'fork', and the
+                   generator or verifier cannot be pickled.
     """
+    if parallel < 1:
+        raise ValueError(f"'parallel' must be at least 1, got {parallel}.")
+
+    if parallel > 1:
+        start_method = (mp_context or multiprocessing).get_start_method()
+        if start_method != "fork":
+            # Fail here rather than with a raw pickling error on the first call
+            try:
+                pickle.dumps((generator, verifier))
+            except Exception as e:
+                raise TypeError(
+                    f"With parallel={parallel} and the '{start_method}' start method, the generator "
+                    f"and verifier must be picklable (e.g. defined at module level): {e}") from e
+
+    if dedupe:
+        verifier = _VerifierCache(verifier)
+
+    # Bound locally, as both are used on every retry
+    _Invalid = TestcaseInvalidError
+    if verbose:
+        def _log(msg: str, *args: Any) -> None:
+            print(msg % args)
+    else:
+        _log = logger.debug
 
     def runner(testcase_index: int) -> tuple[str, str] | NoReturn:
         """
@@ -157,16 +327,16 @@ def generator_runner(generator: Callable[[int, Random], str],
                 # If verification succeeds (no TestcaseInvalidError), return
                 return testcase, answer
 
-            except TestcaseInvalidError as e:
+            except _Invalid as e:
                 # Test case was deemed invalid by the verifier.
                 # Log the error and prepare for the next attempt (if within limit).
-                # TODO: Consider using logging instead of print for better control
-                print(f"[#{testcase_index}] Attempt {retry_count + 1}:\n\tTestcaseInvalidError (retrying):\n\t{e}")
+                _log("[#%d] Attempt %d:\n\tTestcaseInvalidError (retrying):\n\t%s",
+                     testcase_index, retry_count + 1, e)
                 # Increment retry count and loop continues
 
             except Exception as e:
                 # An unexpected, non-TestcaseInvalidError occurred in the generator or verifier.
-                print(f"Unexpected Error Class: {e.__class__}")
+                _log("Unexpected Error Class: %s", e.__class__)
                 # Wrap the exception with context (initial random state) and re-raise immediately.
                 raise GeneratorRuntimeError(
                     f"Unexpected error during generation/verification on attempt {retry_count + 1}. "
@@ -180,7 +350,74 @@ def generator_runner(generator: Callable[[int, Random], str],
         raise RuntimeError(f"Failed to generate a valid test case for index {testcase_index} "
                            f"after {retry_limit} attempts.")
 
-    return runner
+    # Holds the pool created on the first parallel_runner call and reused by
+    # later ones, so workers (and each worker's dedupe cache) survive across
+    # test cases
+    pool: list[ProcessPoolExecutor] = []
+
+    def close() -> None:
+        """Shuts down the worker pool, if one was started."""
+        while pool:
+            pool.pop().shutdown(cancel_futures=True)
+
+    def parallel_runner(testcase_index: int) -> tuple[str, str] | NoReturn:
+        """
+        Same contract as 'runner', but keeps up to 'parallel' attempts running
+        in worker processes and returns the first one that passes verification.
+        """
+        if not pool:
+            pool.append(ProcessPoolExecutor(max_workers=parallel, mp_context=mp_context,
+                                            initializer=_init_worker, initargs=(generator, verifier)))
+        executor = pool[0]
+
+        pending = set()
+        submitted_count = 0
+        retry_count = 0
+        try:
+            while True:
+                # Keep the pool saturated without exceeding the retry limit
+                while len(pending) < parallel and submitted_count != retry_limit:
+                    pending.add(executor.submit(_attempt, testcase_index))
+                    submitted_count += 1
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    status, payload, rnd = future.result()
+                    if status == "ok":
+                        return payload
+                    if status == "invalid":
+                        _log("[#%d] Attempt %d:\n\tTestcaseInvalidError (retrying):\n\t%s",
+                             testcase_index, retry_count + 1, payload)
+                        retry_count += 1
+                    else:
+                        error_type, formatted_traceback = payload
+                        _log("Unexpected Error Class: %s", error_type)
+                        raise GeneratorRuntimeError(
+                            f"Unexpected error during generation/verification on attempt {retry_count + 1}. "
+                            f"Random generator initial state = {rnd.initial_state}", rnd
+                        ) from _WorkerError(formatted_traceback)
+        finally:
+            # Drop queued attempts and let running ones finish before returning,
+            # so they don't compete for CPU with the next call's time-limited
+            # solutions and cause false TLE verdicts
+            for future in pending:
+                future.cancel()
+            wait(pending)
+
+        raise RuntimeError(f"Failed to generate a valid test case for index {testcase_index} "
+                           f"after {retry_limit} attempts.")
+
+    if parallel == 1:
+        runner.close = lambda: None
+        return runner
+
+    parallel_runner.close = close
+    # Shut the pool down with the runner; at exit, concurrent.futures already
+    # cleans up its own workers
+    weakref.finalize(parallel_runner, close).atexit = False
+    return parallel_runner
 
 
 # Example usage block
@@ -257,7 +494,7 @@ if __name__ == '__main__':
     verify_func = verifier_factory(expected=verifier_config, timeout=1.0)
 
     # Create the generator runner
-    run_generation = generator_runner(generator=simple_generator, verifier=verify_func)
+    run_generation = generator_runner(generator=simple_generator, verifier=verify_func, verbose=True)
 
     # Run the generation and verification for test case index 0
     print("Generating and verifying testcase #0...")
@@ -54,42 +54,22 @@ def _truncate_repr(text: str, max_len: int = 50) -> str:
         return represented_text
 
 
-def verifier_factory(expected: ExpectedResults,
-                     *, equal: Callable = eq, timeout: float = 1.0):
+class _Verifier:
     """
-    Factory function to create a tailored verifier function.
-
-    The created verifier takes a test case index and the test case input string.
-    It runs various solutions (provided in the 'expected' dictionary) against
-    this input and checks if their outcomes match the expectations.
+    The verifier created by verifier_factory.
 
-    Args:
-        expected: A dictionary mapping test case indices (int) to another
-                  dictionary. This inner dictionary maps expected outcomes
-                  (AC, WA, TLE class, or other Exception classes) to lists
-                  of solution functions that should produce that outcome.
-                  Solution functions are expected to be decorated with @override_io.
-        equal: A function used to compare the outputs of solutions. Defaults to
-               operator.eq. Useful for custom comparisons (e.g., float tolerance).
-        timeout: The time limit in seconds applied to each solution execution.
+    It is a module-level class rather than a closure so that it can be
+    pickled, e.g. to the worker processes of generator_runner(parallel=N).
+    """
 
-    Returns:
-        A verifier function. This function takes (testcase_index, testcase_string)
-        and returns the correct answer string (from the first AC solution) if
-        the verification is successful. It raises TestcaseInvalidError if the
-        test case fails to meet the expected differentiation criteria, or other
-        errors for configuration issues.
+    def __init__(self, expected: ExpectedResults, equal: Callable, timeout: float):
+        self.expected = expected
+        self.equal = equal
+        self.timeout = timeout
 
-    Raises:
-        ValueError: If no AC solution is provided for a configured test case index.
-        TypeError: If an expected outcome key is not AC, WA, or an Exception type.
-        TestcaseInvalidError: If a solution does not behave as expected for the given
-                              test case (e.g., an expected WA solution gives the same
-                              output as AC, or an expected RE solution runs successfully).
-    """
-    def verifier(testcase_index: int, testcase) -> Union[str, NotImplemented, NoReturn]:
+    def __call__(self, testcase_index: int, testcase) -> Union[str, NotImplemented, NoReturn]:
         """
-        The verifier function generated by the factory.
+        Runs the verification.
 
         Checks a given test case against the configured expected outcomes for
         the specified test case index.
@@ -109,6 +89,8 @@ def verifier_factory(expected: ExpectedResults,
             NotImplementedError: If testcase_index is not found in 'expected' dict.
                                  (Consider changing this to KeyError or similar).
         """
+        expected, equal, timeout = self.expected, self.equal, self.timeout
+
         # Retrieve the expected outcomes for this specific test case index
         if (res_to_sols := expected.get(testcase_index)) is None:
             # Configuration for this index not found.
@@ -236,4 +218,38 @@ def verifier_factory(expected: ExpectedResults,
         # Return the reference answer obtained from the first AC solution.
         return reference_answer_output
 
-    return verifier
+
+def verifier_factory(expected: ExpectedResults,
+                     *, equal: Callable = eq, timeout: float = 1.0):
+    """
+    Factory function to create a tailored verifier function.
+
+    The created verifier takes a test case index and the test case input string.
+    It runs various solutions (provided in the 'expected' dictionary) against
+    this input and checks if their outcomes match the expectations.
+
+    Args:
+        expected: A dictionary mapping test case indices (int) to another
+                  dictionary. This inner dictionary maps expected outcomes
+                  (AC, WA, TLE class, or other Exception classes) to lists
+                  of solution functions that should produce that outcome.
+                  Solution functions are expected to be decorated with @override_io.
+        equal: A function used to compare the outputs of solutions. Defaults to
+               operator.eq. Useful for custom comparisons (e.g., float tolerance).
+        timeout: The time limit in seconds applied to each solution execution.
+
+    Returns:
+        A verifier callable. It takes (testcase_index, testcase_string)
+        and returns the correct answer string (from the first AC solution) if
+        the verification is successful. It raises TestcaseInvalidError if the
+        test case fails to meet the expected differentiation criteria, or other
+        errors for configuration issues.
+
+    Raises:
+        ValueError: If no AC solution is provided for a configured test case index.
+        TypeError: If an expected outcome key is not AC, WA, or an Exception type.
+        TestcaseInvalidError: If a solution does not behave as expected for the given
+                              test case (e.g., an expected WA solution gives the same
+                              output as AC, or an expected RE solution runs successfully).
+    """
+    return _Verifier(expected, equal, timeout)
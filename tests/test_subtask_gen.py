@@ -0,0 +1,65 @@
+import multiprocessing
+import pickle
+from random import Random
+
+import pytest
+
+from generator_helper.sol_dec import override_io
+from generator_helper.subtask_gen import generator_runner
+from generator_helper.verifier import AC, WA, verifier_factory
+
+
+@override_io
+def ac_sol(testcase_index=None):
+    n, r = map(int, input().split())
+    print(n)
+
+
+@override_io
+def wa_sol(testcase_index=None):
+    n, r = map(int, input().split())
+    print(r)
+
+
+def simple_generator(testcase_idx: int, rnd: Random) -> str:
+    return f"{testcase_idx} {rnd.randint(1, 3)}"
+
+
+START_METHODS = multiprocessing.get_all_start_methods()
+
+
+def test_factory_verifier_is_picklable():
+    verifier = verifier_factory({2: {AC: [ac_sol], WA: [wa_sol]}})
+    assert pickle.loads(pickle.dumps(verifier))(2, "2 3") == "2\n"
+
+
+@pytest.mark.parametrize("start_method", START_METHODS)
+def test_parallel_runner_with_factory_verifier(start_method):
+    verifier = verifier_factory({2: {AC: [ac_sol], WA: [wa_sol]}})
+    run = generator_runner(simple_generator, verifier, parallel=2,
+                           mp_context=multiprocessing.get_context(start_method))
+    try:
+        for _ in range(3):
+            testcase, answer = run(2)
+            n, r = map(int, testcase.split())
+            assert n == 2 and r != 2
+            assert answer == "2\n"
+    finally:
+        run.close()
+
+
+def test_close_shuts_down_workers():
+    verifier = verifier_factory({2: {AC: [ac_sol], WA: [wa_sol]}})
+    run = generator_runner(simple_generator, verifier, parallel=2)
+    run(2)
+    assert multiprocessing.active_children()
+    run.close()
+    assert not multiprocessing.active_children()
+
+
+@pytest.mark.parametrize("start_method", [m for m in START_METHODS if m != "fork"])
+def test_unpicklable_generator_is_rejected_up_front(start_method):
+    verifier = verifier_factory({2: {AC: [ac_sol], WA: [wa_sol]}})
+    with pytest.raises(TypeError, match="picklable"):
+        generator_runner(lambda idx, rnd: "2 3", verifier, parallel=2,
+                         mp_context=multiprocessing.get_context(start_method))